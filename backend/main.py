@@ -1,8 +1,11 @@
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
 from backend.data.database import create_db_and_tables, add_data
-from backend.routers.router import router
+from backend.routers.router import router, clear_cache, warm_cache
 
 app = FastAPI(
     title="Paralympics Data API",
@@ -25,18 +28,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses for clients that accept gzip. Responses that already set Content-Encoding are passed
+# through unchanged, e.g. the pre-compressed /api/paralympics/all payload.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include the router defined in router.py
 app.include_router(router)
 
 @app.on_event("startup")
-def on_startup():
-    """Check database connection on startup"""
+async def on_startup():
+    """Check database connection on startup and pre-build the cached games payload"""
     create_db_and_tables()
     # add_data() # Uncomment only if database is empty
+    clear_cache()
+    await warm_cache()
 
 @app.get("/")
 def root():
     return {"message": "Backend API is running."}
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
\ No newline at end of file
+    if os.environ.get("DEV"):
+        # Development: auto-reload on code changes (single process)
+        uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+    else:
+        # One worker process per CPU. Uvicorn picks uvloop and httptools automatically when they are installed
+        # (uvicorn[standard] does not install uvloop on Windows)
+        uvicorn.run("main:app", host="127.0.0.1", port=8000,
+                    workers=os.cpu_count(),
+                    log_level="warning")
\ No newline at end of file
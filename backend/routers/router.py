@@ -1,4 +1,12 @@
-from fastapi import APIRouter
+import asyncio
+import gzip
+from functools import lru_cache
+
+import orjson
+import pyarrow as pa
+from fastapi import APIRouter, Request, Response
+from fastapi.concurrency import run_in_threadpool
+
 from backend.data.database import engine
 from backend.services.query_service import QueryService
 
@@ -7,8 +15,81 @@ router = APIRouter(
     tags=["Paralympics"]
 )
 
-@router.get("/all")
-def get_all_paralympics_data():
+# The games data is static, so each encoding of it (and its gzip version) is built once and reused for every request.
+JSON_MEDIA_TYPE = "application/json"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+GZIP_COMPRESS_LEVEL = 5
+# Maps media type to (payload, gzip compressed payload)
+_CACHED_PAYLOADS: dict[str, tuple[bytes, bytes]] = {}
+_CACHE_LOCK = asyncio.Lock()
+
+# OpenAPI description of the pre-encoded responses, which FastAPI cannot infer from a plain Response
+JSON_RESPONSE_DOC = {200: {"content": {JSON_MEDIA_TYPE: {}}, "description": "Flattened games data as JSON"}}
+ALL_RESPONSES_DOC = {200: {"content": {JSON_MEDIA_TYPE: {}, ARROW_MEDIA_TYPE: {}},
+                           "description": "Flattened games data as JSON, or as an Arrow IPC stream if requested"}}
+
+
+def to_arrow_stream(rows: list[dict]) -> bytes:
+    """Encode the rows as an Arrow IPC stream, which pandas can load into typed columns without parsing JSON."""
+    table = pa.Table.from_pylist(rows)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+async def warm_cache() -> dict[str, tuple[bytes, bytes]]:
+    """Run the flatten query once and store the JSON and Arrow encoded results, each with a gzip compressed copy.
+
+    The query uses a blocking database session, so it runs in the threadpool rather than on the event loop.
+    """
+    global _CACHED_PAYLOADS
+    async with _CACHE_LOCK:
+        if not _CACHED_PAYLOADS:
+            qs = QueryService(engine)
+            data = await run_in_threadpool(qs.get_all_games_data_flattened)
+            encoded = {JSON_MEDIA_TYPE: orjson.dumps(data), ARROW_MEDIA_TYPE: to_arrow_stream(data)}
+            _CACHED_PAYLOADS = {
+                media_type: (payload, gzip.compress(payload, compresslevel=GZIP_COMPRESS_LEVEL))
+                for media_type, payload in encoded.items()
+            }
+    return _CACHED_PAYLOADS
+
+
+def clear_cache() -> None:
+    """Drop the cached payloads so the next request re-reads the database."""
+    global _CACHED_PAYLOADS
+    _CACHED_PAYLOADS = {}
+    filtered_payload.cache_clear()
+
+
+@lru_cache(maxsize=64)
+def filtered_payload(event_type: str | None, min_year: int | None, max_year: int | None) -> bytes:
+    """Query and encode one filtered slice of the games data, cached per combination of filter values."""
     qs = QueryService(engine)
-    data = qs.get_all_games_data_flattened()
-    return data
\ No newline at end of file
+    return orjson.dumps(qs.get_filtered_games_data_flattened(event_type, min_year, max_year))
+
+
+@router.get("/all", response_model=None, response_class=Response, responses=ALL_RESPONSES_DOC)
+async def get_all_paralympics_data(request: Request):
+    """All games as JSON, or as an Arrow IPC stream when the client sends Accept: application/vnd.apache.arrow.stream"""
+    payloads = _CACHED_PAYLOADS or await warm_cache()
+    media_type = ARROW_MEDIA_TYPE if ARROW_MEDIA_TYPE in request.headers.get("accept", "") else JSON_MEDIA_TYPE
+    payload, gzip_payload = payloads[media_type]
+    # Send the pre-compressed copy when the client accepts it, so GZipMiddleware does not compress it per request
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(content=gzip_payload,
+                        media_type=media_type,
+                        headers={"Content-Encoding": "gzip", "Vary": "Accept, Accept-Encoding"})
+    return Response(content=payload, media_type=media_type, headers={"Vary": "Accept"})
+
+
+@router.get("", response_model=None, response_class=Response, responses=JSON_RESPONSE_DOC)
+async def get_filtered_paralympics_data(event_type: str | None = None,
+                                        min_year: int | None = None,
+                                        max_year: int | None = None):
+    """Games filtered by type and year range, e.g. /api/paralympics?event_type=summer&min_year=1960&max_year=2030"""
+    if event_type:
+        event_type = event_type.lower()
+    payload = await run_in_threadpool(filtered_payload, event_type, min_year, max_year)
+    return Response(content=payload, media_type=JSON_MEDIA_TYPE)
@@ -20,7 +20,7 @@ Developers using frameworks such as FastAPI often use an architecture that separ
 This activity is only using SQLModel, though you can use Pydantic schemas in coursework 2 if you wish.
 Do not use FastAPI for this coursework please, that is in COMP0034.
 """
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy import Sequence
 from sqlmodel import Session, select
@@ -58,8 +58,27 @@ class QueryService:
         self.engine = eng
 
     def get_all_games_data_flattened(self) -> List[dict]:
+        return self.get_filtered_games_data_flattened()
+
+    def get_filtered_games_data_flattened(self, event_type: Optional[str] = None, min_year: Optional[int] = None,
+                                          max_year: Optional[int] = None) -> List[dict]:
+        """ Flattened games data, filtered in the database rather than after loading all rows.
+            SQL equivalent:
+                SELECT * FROM games
+                WHERE games.event_type = ? AND games.year >= ? AND games.year <= ?
+                ORDER BY games.year
+            Each condition is only added when its argument is given.
+        """
+        statement = select(Games).order_by(Games.year)
+        if event_type:
+            statement = statement.where(Games.event_type == event_type)
+        if min_year is not None:
+            statement = statement.where(Games.year >= min_year)
+        if max_year is not None:
+            statement = statement.where(Games.year <= max_year)
+
         with Session(self.engine) as session:
-            games = session.exec(select(Games).order_by(Games.year)).all()
+            games = session.exec(statement).all()
 
             flattened_data = []
             for game in games:
@@ -1,6 +1,8 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import requests
+import pyarrow as pa
+import httpx
 import altair as alt
 import plotly.express as px
 
@@ -13,9 +15,20 @@ st.set_page_config(
 
 # Backend API URL to get all the data
 API_URL = "http://127.0.0.1:8000/api/paralympics/all"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
 
 
 # --- 2. Data Fetching & Caching ---
+@st.cache_resource
+def get_client():
+    """
+    Create one httpx Client for the app so the connection to the backend is kept alive and reused.
+    Uses cache_resource because Streamlit re-runs the script on every interaction, which would otherwise create a
+    new Client each time.
+    """
+    return httpx.Client(timeout=10.0, headers={'Accept-Encoding': 'gzip', 'Accept': ARROW_MEDIA_TYPE})
+
+
 @st.cache_data
 def load_data():
     """
@@ -23,15 +36,34 @@ def load_data():
     Uses cache_data to prevent re-requesting the API on every page refresh.
     """
     try:
-        response = requests.get(API_URL)
+        response = get_client().get(API_URL)
         if response.status_code == 200:
-            data = response.json()
-            df = pd.DataFrame(data)
+            # The backend sends an Arrow stream (see get_client), which loads straight into typed columns
+            df = pa.ipc.open_stream(response.content).read_all().to_pandas()
 
             # Basic data cleaning to fill out NaN values
-            for col in df.columns:
-                df[col] = df[col].fillna(0)
-            return df
+            df = df.fillna(0)
+
+            # Store numbers in the narrowest integer type and repeated labels as categories to reduce memory
+            for col in ['year', 'events', 'sports', 'countries_count',
+                        'participants_total', 'participants_m', 'participants_f']:
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+
+            # Prepare derived columns once here so reruns only need to slice the data
+            df['event_type'] = df['event_type'].astype(str).str.lower()
+            # Handle combined hosts like "Stoke Mandeville, New York" -> pick first for map
+            df['first_host'] = df['host'].astype(str).str.split(',', n=1).str[0].str.strip()
+            # Convert comma-separated disabilities to a string of tags
+            tags = df['disabilities'].astype(str).str.split(',').explode().str.strip()
+            tags = '`' + tags[tags != ''] + '`'
+            df['disabilities_tags'] = tags.groupby(level=0).agg(', '.join).reindex(df.index, fill_value='')
+            coords = _COORDS.reindex(df['first_host'].to_numpy())
+            df[['lat', 'lon']] = coords.to_numpy()
+
+            for col in ['event_type', 'host', 'country']:
+                df[col] = df[col].astype('category')
+            # Index on game_id so single game lookups are a hash lookup rather than a scan
+            return df.set_index('game_id', drop=False)
         else:
             st.error(f"Failed to fetch data: {response.status_code}")
             return pd.DataFrame()
@@ -51,21 +83,15 @@ def local_get_all(df):
 
 def local_get_by_id(df, game_id):
     """Mimic GET /games/{id}: Return data for a specific ID"""
-    result = df[df['game_id'] == game_id]
-    return result.iloc[0] if not result.empty else None
+    return df.loc[game_id] if game_id in df.index else None
 
 
 def local_filter_by_type_and_year(df, event_type=None, min_year=1960, max_year=2030):
     """Mimic GET /games?type=...&year_gt=..."""
-    filtered_df = df.copy()
+    mask = (df['year'] >= min_year) & (df['year'] <= max_year)
     if event_type and event_type != "All":
-        filtered_df = filtered_df[filtered_df['event_type'] == event_type.lower()]
-
-    filtered_df = filtered_df[
-        (filtered_df['year'] >= min_year) &
-        (filtered_df['year'] <= max_year)
-        ]
-    return filtered_df
+        mask &= df['event_type'] == event_type.lower()
+    return df.loc[mask]
 
 
 # Helper Functions: City Coordinates for Map
@@ -105,13 +131,51 @@ HOST_COORDINATES = {
     "French Alps": {"lat": 45.5, "lon": 6.5},  # Approx
 }
 
+# The same coordinates as a table indexed by host name, so all hosts can be looked up in one reindex
+_COORDS = pd.DataFrame.from_dict(HOST_COORDINATES, orient='index')[['lat', 'lon']]
 
-def get_lat_lon(host_name):
-    # Handle combined hosts like "Stoke Mandeville, New York" -> pick first for map
-    first_host = host_name.split(',')[0].strip() if host_name else ""
-    if str(first_host) in HOST_COORDINATES:
-        return HOST_COORDINATES[first_host]['lat'], HOST_COORDINATES[first_host]['lon']
-    return None, None
+
+@st.cache_data
+def game_options():
+    """
+    Build the "Year - Host (type)" labels for the game selectbox, newest first.
+    Reads the data through the cached load_data() like compute_view, so the options are only built once.
+    """
+    df = load_data()
+    years = df['year'].to_numpy()
+    hosts = df['host'].to_numpy()
+    event_types = df['event_type'].to_numpy()
+    game_ids = df['game_id'].to_numpy()
+    order = np.argsort(-years, kind='stable')
+    return {f"{years[i]} - {hosts[i]} ({event_types[i]})": game_ids[i] for i in order}
+
+
+@st.cache_data(max_entries=32)
+def compute_view(selected_type, min_year, max_year):
+    """
+    Filter the games and compute the key metrics for one sidebar selection.
+    Reads the data through the cached load_data() rather than taking the DataFrame as an argument, so Streamlit
+    only hashes the three filter values. Returns (filtered_df, total_participants, total_countries, latest_host).
+    """
+    filtered_df = local_filter_by_type_and_year(load_data(), selected_type, min_year, max_year)
+    total_participants = int(filtered_df['participants_total'].sum())
+    total_countries = int(filtered_df['countries_count'].sum())
+    latest_host = filtered_df['host'].iat[filtered_df['year'].to_numpy().argmax()] if not filtered_df.empty else "-"
+    return filtered_df, total_participants, total_countries, latest_host
+
+
+@st.cache_data(max_entries=32)
+def compute_gender_view(selected_type, min_year, max_year):
+    """
+    Long format Male/Female participant counts for the gender chart, cached per sidebar selection like compute_view.
+    Stacks two labelled slices of the filtered data rather than using melt and replace.
+    """
+    filtered_df = compute_view(selected_type, min_year, max_year)[0]
+    parts = [
+        filtered_df[['year', 'event_type', col]].rename(columns={col: 'Count'}).assign(Gender=gender)
+        for col, gender in (('participants_m', 'Male'), ('participants_f', 'Female'))
+    ]
+    return pd.concat(parts, ignore_index=True)
 
 
 # --- 4. Streamlit UI Main Program ---
@@ -139,7 +203,9 @@ def main():
                                    (1960, max_year))
 
     # Use simulated API functions to process data
-    filtered_df = local_filter_by_type_and_year(raw_df, selected_type, year_range[0], year_range[1])
+    filtered_df, total_participants, total_countries, latest_host = compute_view(selected_type,
+                                                                                year_range[0],
+                                                                                year_range[1])
 
     # B. Header Area
     st.title("Streamlit Demo")
@@ -150,14 +216,10 @@ def main():
     with col1:
         st.metric("Total Games Held", len(filtered_df))
     with col2:
-        total_participants = int(filtered_df['participants_total'].sum())
         st.metric("Total Athletes", f"{total_participants:,}")
     with col3:
-        total_countries = int(filtered_df['countries_count'].sum())
         st.metric("Total Countries", total_countries)
     with col4:
-        latest_game = filtered_df.sort_values('year', ascending=False).iloc[0]
-        latest_host = latest_game['host']
         st.metric("Latest Host in Range", latest_host)
 
     st.markdown("---")
@@ -170,7 +232,9 @@ def main():
         st.markdown("#### Total Participants over Years")
 
         # 1. Line Chart (Altair) - Participants over time
-        chart_participants = alt.Chart(filtered_df).mark_line(point=True).encode(
+        # Each chart is given only the columns it uses, so less data is serialised and sent to the browser
+        chart_df = filtered_df[['year', 'host', 'participants_total', 'sports', 'event_type']]
+        chart_participants = alt.Chart(chart_df).mark_line(point=True).encode(
             x=alt.X('year:O', title='Year'),
             y=alt.Y('participants_total:Q', title='Total Participants'),
             color=alt.Color('event_type:N', title='Type',
@@ -188,8 +252,9 @@ def main():
         with col_left:
             # 2. Bubble Chart (Plotly) - Sports vs Countries Count
             st.markdown("#### Sports vs. Countries Involved")
+            bubble_df = filtered_df[['countries_count', 'sports', 'participants_total', 'event_type', 'host']]
             fig_bubble = px.scatter(
-                filtered_df,
+                bubble_df,
                 x="countries_count",
                 y="sports",
                 size="participants_total",
@@ -207,10 +272,7 @@ def main():
             # 3. Map Visualization
             st.markdown("#### Global Host Locations")
 
-            map_df = filtered_df.copy()
-            map_df[['lat', 'lon']] = map_df['host'].apply(
-                lambda x: pd.Series(get_lat_lon(x))
-            )
+            map_df = filtered_df[['lat', 'lon', 'event_type', 'host', 'year', 'participants_total', 'country']]
 
             if not map_df.empty:
                 fig_map = px.scatter_geo(
@@ -242,12 +304,7 @@ def main():
         st.markdown("Comparing Male vs Female participation numbers over the years.")
 
         # Prepare stacked data
-        gender_df = filtered_df[['year', 'event_type', 'participants_m', 'participants_f']].copy()
-        gender_df = gender_df.melt(id_vars=['year', 'event_type'],
-                                   value_vars=['participants_m', 'participants_f'],
-                                   var_name='Gender', value_name='Count')
-
-        gender_df['Gender'] = gender_df['Gender'].replace({'participants_m': 'Male', 'participants_f': 'Female'})
+        gender_df = compute_gender_view(selected_type, year_range[0], year_range[1])
 
         # Stacked Area Chart
         chart_gender = alt.Chart(gender_df).mark_area(opacity=0.6).encode(
@@ -265,11 +322,10 @@ def main():
         st.subheader("Explore Specific Games")
 
         # 1. Selectbox gets all available Games, formatted as "Year - Host"
-        game_options = {f"{row['year']} - {row['host']} ({row['event_type']})": row['game_id']
-                        for index, row in raw_df.sort_values('year', ascending=False).iterrows()}
+        options = game_options()
 
-        selected_label = st.selectbox("Select a Game to view details:", list(game_options.keys()))
-        selected_id = game_options[selected_label]
+        selected_label = st.selectbox("Select a Game to view details:", list(options.keys()))
+        selected_id = options[selected_label]
 
         # 2. Call the "Mimic API Function" to get single row
         game_detail = local_get_by_id(raw_df, selected_id)
@@ -284,9 +340,7 @@ def main():
                     st.write(f"**Country:** {game_detail['country']}")
                     st.write(f"**Dates:** {game_detail['start_date']} to {game_detail['end_date']}")
                     st.write(f"**Disabilities Included:**")
-                    # Convert comma-separated string to tags
-                    disabilities = str(game_detail.get('disabilities', '')).split(',')
-                    st.write(", ".join([f"`{d.strip()}`" for d in disabilities if d]))
+                    st.write(game_detail['disabilities_tags'])
 
                 with c2:
                     st.success(f"**Highlights:** {game_detail['highlights']}")